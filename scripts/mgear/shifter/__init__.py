@@ -108,6 +108,9 @@ def reloadComponents(*args):
             except ImportError:
                 pass
 
+    # the guide classes cache is pointing to the old modules
+    guide.clear_guide_class_cache()
+
 
 class Rig(object):
     """The main rig class.
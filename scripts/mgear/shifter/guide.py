@@ -1,25 +1,24 @@
 # Built-in
 import datetime
 import getpass
-import imp
 import inspect
 import json
+import math
 import os
-import shutil
 import subprocess
 import sys
+import time
 import traceback
 from functools import partial
 
 
+import maya.cmds as cmds
 # pymel
 import pymel.core as pm
-from pymel.core import datatypes
 
 # mgear
 import mgear
-from mgear.core import attribute, dag, vector, pyqt, skin, string, fcurve
-from mgear.core import utils, curve
+from mgear.core import attribute, dag, pyqt, string, utils
 from mgear.vendor.Qt import QtCore, QtWidgets, QtGui
 
 from . import guide_ui as guui
@@ -37,6 +36,163 @@ TYPE = "mgear_guide_root"
 
 MGEAR_SHIFTER_CUSTOMSTEP_KEY = "MGEAR_SHIFTER_CUSTOMSTEP_PATH"
 
+# Component guide classes already imported. Keys are the component type.
+_GUIDE_CLASS_CACHE = {}
+
+
+def clear_guide_class_cache():
+    """Clear the cached component guide classes.
+
+    Should be called after reloading the components, so the next guide
+    lookup uses the reloaded modules.
+    """
+    _GUIDE_CLASS_CACHE.clear()
+
+
+# Maya and mGear versions don't change during the session.
+_VERSIONS_CACHE = {}
+
+
+def _get_versions():
+    """Get the Maya and mGear versions stored in the guide.
+
+    The versions are only evaluated the first time.
+
+    Returns:
+        tuple: Maya version and mGear version strings.
+    """
+    if not _VERSIONS_CACHE:
+        _VERSIONS_CACHE["maya_version"] = str(
+            pm.mel.eval("getApplicationVersionAsFloat"))
+        _VERSIONS_CACHE["gear_version"] = mgear.getVersion()
+    return (_VERSIONS_CACHE["maya_version"],
+            _VERSIONS_CACHE["gear_version"])
+
+
+# Synoptic tabs folders by path. Values are (mtime, tabs)
+_SYNOPTIC_CACHE = {}
+
+
+def _get_synoptic_tabs(path):
+    """Get the sorted synoptic tab folders in a path.
+
+    The folder is only scanned again if its modification time changed.
+
+    Arguments:
+        path (str): The synoptic tabs folder.
+
+    Returns:
+        list: The sorted tab folder names.
+    """
+    mtime = os.path.getmtime(path)
+    cached = _SYNOPTIC_CACHE.get(path)
+    if cached and cached[0] == mtime:
+        return cached[1]
+
+    tabs = sorted([name for name in os.listdir(path) if
+                   os.path.isdir(os.path.join(path, name))])
+    _SYNOPTIC_CACHE[path] = (mtime, tabs)
+    return tabs
+
+
+# Open a file with the default application of the OS
+if sys.platform.startswith('darwin'):
+    def _open_file(path):
+        subprocess.call(('open', path))
+elif os.name == 'nt':
+    _open_file = os.startfile
+else:
+    def _open_file(path):
+        subprocess.call(('xdg-open', path))
+
+
+def _stem(path):
+    """Get the file name of a path, without anything after its first dot.
+
+    Same as os.path.split(path)[1].split(".")[0], without the
+    intermediate tuple and list.
+
+    Arguments:
+        path (str): The file path.
+
+    Returns:
+        str: The file name stem.
+    """
+    i = path.rfind(os.sep)
+    if os.altsep:
+        i = max(i, path.rfind(os.altsep))
+    dot = path.find(".", i + 1)
+    if dot < 0:
+        return path[i + 1:]
+    return path[i + 1:dot]
+
+
+def _custom_step_relpath(path, base_abs):
+    """Get a custom step path relative to the custom steps root folder.
+
+    Arguments:
+        path (str): The custom step file path.
+        base_abs (str): The absolute path of the custom steps root.
+
+    Returns:
+        str: The path without the root and its separator.
+    """
+    return os.path.abspath(path).replace(base_abs, "", 1)[1:]
+
+
+def _read_file(path):
+    """Read the content of a text file.
+
+    Arguments:
+        path (str): The file path.
+
+    Returns:
+        str: The file content.
+    """
+    with open(path, "r") as f:
+        return f.read()
+
+
+# Custom step modules with a CustomShifterStep class by path.
+# Values are (mtime, module)
+_STEP_CACHE = {}
+
+
+def _load_step_module(name, path):
+    """Load a custom step module from a file.
+
+    Modules with a CustomShifterStep class are reused until the file
+    changes. Simple scripts run their code on load, so they are always
+    loaded again.
+
+    Arguments:
+        name (str): The module name.
+        path (str): The custom step file path.
+
+    Returns:
+        module: The custom step module.
+    """
+    mtime = os.path.getmtime(path)
+    cached = _STEP_CACHE.get(path)
+    if cached and cached[0] == mtime:
+        return cached[1]
+
+    try:
+        import importlib.util
+    except ImportError:
+        # imp is deprecated in Python 3, only import it when needed
+        import imp
+        module = imp.load_source(name, path)
+    else:
+        spec = importlib.util.spec_from_file_location(name, path)
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[name] = module
+        spec.loader.exec_module(module)
+
+    if hasattr(module, "CustomShifterStep"):
+        _STEP_CACHE[path] = (mtime, module)
+    return module
+
 
 class Main(object):
     """The main guide class
@@ -55,6 +211,8 @@ class Main(object):
 
     """
 
+    __slots__ = ("paramNames", "paramDefs", "values", "valid")
+
     def __init__(self):
 
         self.paramNames = []
@@ -91,23 +249,26 @@ class Main(object):
 
         """
 
-        if scriptName not in self.paramDefs.keys():
+        pd = self.paramDefs.get(scriptName)
+        if pd is None:
             mgear.log("Can't find parameter definition for : " + scriptName,
                       mgear.sev_warning)
             return False
 
-        self.paramDefs[scriptName].value = value
+        pd.value = value
         self.values[scriptName] = value
 
         return True
 
     def setParamDefValuesFromDict(self, values_dict):
+        values = self.values
         for scriptName, paramDef in self.paramDefs.items():
             if scriptName not in values_dict:
                 # Data is old, lacks parameter that current definition has.
                 continue
-            paramDef.value = values_dict[scriptName]
-            self.values[scriptName] = values_dict[scriptName]
+            value = values_dict[scriptName]
+            paramDef.value = value
+            values[scriptName] = value
 
     def setParamDefValuesFromProperty(self, node):
         """Set the parameter definition values from the attributes of an object
@@ -116,27 +277,36 @@ class Main(object):
             node (dagNode): The object with the attributes.
         """
 
+        nodeName = node.name()
+        # query the existing attributes once instead of once per parameter
+        existing = set(cmds.listAttr(nodeName) or [])
+        FCurveParamDef = attribute.FCurveParamDef
         for scriptName, paramDef in self.paramDefs.items():
-            if not pm.attributeQuery(scriptName, node=node, exists=True):
+            if scriptName not in existing:
                 mgear.log("Can't find parameter '%s' in %s" %
                           (scriptName, node), mgear.sev_warning)
                 self.valid = False
             else:
-                cnx = pm.listConnections(
-                    node + "." + scriptName,
-                    destination=False, source=True)
-                if isinstance(paramDef, attribute.FCurveParamDef):
+                plug = "{}.{}".format(nodeName, scriptName)
+                cnx = cmds.listConnections(
+                    plug, destination=False, source=True)
+                if isinstance(paramDef, FCurveParamDef):
+                    from mgear.core import fcurve
                     paramDef.value = fcurve.getFCurveValues(
-                        cnx[0],
+                        pm.PyNode(cnx[0]),
                         self.get_divisions())
                     self.values[scriptName] = paramDef.value
                 elif cnx:
                     paramDef.value = None
-                    self.values[scriptName] = cnx[0]
+                    self.values[scriptName] = pm.PyNode(cnx[0])
                 else:
-                    paramDef.value = pm.getAttr(node + "." + scriptName)
-                    self.values[scriptName] = pm.getAttr(
-                        node + "." + scriptName)
+                    val = cmds.getAttr(plug)
+                    # compound attributes (ie. colors) are returned by cmds
+                    # as a list with a single tuple
+                    if isinstance(val, list) and len(val) == 1:
+                        val = val[0]
+                    paramDef.value = val
+                    self.values[scriptName] = val
 
     def addColorParam(self, scriptName, value=False):
         """Add color paramenter to the paramenter definition Dictionary.
@@ -228,8 +398,9 @@ class Main(object):
 
     def get_param_values(self):
         param_values = {}
+        paramDefs = self.paramDefs
         for pn in self.paramNames:
-            pd = self.paramDefs[pn].get_as_dict()
+            pd = paramDefs[pn].get_as_dict()
             param_values[pn] = pd['value']
 
         return param_values
@@ -265,6 +436,104 @@ class Rig(Main):
             as self.components
     """
 
+    # Rig options parameters definition, in creation order.
+    # (attribute name, scriptName, valueType, value, extra)
+    # extra is (minimum, maximum) for numeric parameters and the tuple of
+    # elements for "enum" parameters. The elements are copied to a new list
+    # for each instance.
+    # The "user", "date", "maya_version" and "gear_version" values are
+    # evaluated when the parameters are added.
+    _PARAM_SCHEMA = (
+        # --------------------------------------------------
+        # Main Tab
+        ("pRigName", "rig_name", "string", "rig", None),
+        ("pMode", "mode", "enum", 0, ("Final", "WIP")),
+        ("pStep", "step", "enum", 6,
+         ("All Steps", "Objects", "Properties",
+          "Operators", "Connect", "Joints", "Finalize")),
+        ("pIsModel", "ismodel", "bool", True, None),
+        ("pClassicChannelNames", "classicChannelNames", "bool", False, None),
+        ("pProxyChannels", "proxyChannels", "bool", False, None),
+        ("pAttributePrefixUseCompName", "attrPrefixName", "bool", False,
+         None),
+        ("pWorldCtl", "worldCtl", "bool", False, None),
+        ("pWorldCtl_name", "world_ctl_name", "string", "world_ctl", None),
+
+        # --------------------------------------------------
+        # skin
+        ("pSkin", "importSkin", "bool", False, None),
+        ("pSkinPackPath", "skin", "string", "", None),
+
+        # --------------------------------------------------
+        # Colors
+
+        # Index color
+        ("pLColorIndexfk", "L_color_fk", "long", 6, (0, 31)),
+        ("pLColorIndexik", "L_color_ik", "long", 18, (0, 31)),
+        ("pRColorIndexfk", "R_color_fk", "long", 23, (0, 31)),
+        ("pRColorIndexik", "R_color_ik", "long", 14, (0, 31)),
+        ("pCColorIndexfk", "C_color_fk", "long", 13, (0, 31)),
+        ("pCColorIndexik", "C_color_ik", "long", 17, (0, 31)),
+
+        # RGB colors for Maya 2015 and up
+        # ("pLColorfk", "L_RGB_fk", "color", [0, 1, 0], None),
+        # ("pLColorik", "L_RGB_ik", "color", [0, .5, 0], None),
+        # ("pRColorfk", "R_RGB_fk", "color", [0, 0, 1], None),
+        # ("pRColorik", "R_RGB_ik", "color", [0, 0, .6], None),
+        # ("pCColorfk", "C_RGB_fk", "color", [1, 0, 0], None),
+        # ("pCColorik", "C_RGB_ik", "color", [.6, 0, 0], None),
+
+        # --------------------------------------------------
+        # Settings
+        ("pJointRig", "joint_rig", "bool", True, None),
+        ("pForceUniScale", "force_uniScale", "bool", True, None),
+        ("pSynoptic", "synoptic", "string", "", None),
+
+        ("pDoPreCustomStep", "doPreCustomStep", "bool", False, None),
+        ("pDoPostCustomStep", "doPostCustomStep", "bool", False, None),
+        ("pPreCustomStep", "preCustomStep", "string", "", None),
+        ("pPostCustomStep", "postCustomStep", "string", "", None),
+
+        # --------------------------------------------------
+        # Comments
+        ("pComments", "comments", "string", "", None),
+        ("pUser", "user", "string", None, None),
+        ("pDate", "date", "string", None, None),
+        ("pMayaVersion", "maya_version", "string", None, None),
+        ("pGearVersion", "gear_version", "string", None, None),
+
+        # --------------------------------------------------
+        # Naming rules
+        ("p_ctl_name_rule", "ctl_name_rule", "string",
+         naming.DEFAULT_NAMING_RULE, None),
+        ("p_joint_name_rule", "joint_name_rule", "string",
+         naming.DEFAULT_NAMING_RULE, None),
+        ("p_side_left_name", "side_left_name", "string",
+         naming.DEFAULT_SIDE_L_NAME, None),
+        ("p_side_right_name", "side_right_name", "string",
+         naming.DEFAULT_SIDE_R_NAME, None),
+        ("p_side_center_name", "side_center_name", "string",
+         naming.DEFAULT_SIDE_C_NAME, None),
+        ("p_ctl_name_ext", "ctl_name_ext", "string",
+         naming.DEFAULT_CTL_EXT_NAME, None),
+        ("p_joint_name_ext", "joint_name_ext", "string",
+         naming.DEFAULT_JOINT_EXT_NAME, None),
+
+        ("p_ctl_des_letter_case", "ctl_description_letter_case", "enum", 0,
+         ("Default", "Upper Case", "Lower Case", "Capitalization")),
+        ("p_joint_des_letter_case", "joint_description_letter_case", "enum",
+         0, ("Default", "Upper Case", "Lower Case", "Capitalization")),
+    )
+
+    __slots__ = ("controllers",
+                 "components",
+                 "componentsIndex",
+                 "parents",
+                 "guide_template_dict",
+                 "model",
+                 "controllers_org",
+                 "options") + tuple(p[0] for p in _PARAM_SCHEMA)
+
     def __init__(self):
 
         # Parameters names, definition and values.
@@ -287,113 +556,41 @@ class Rig(Main):
 
         Add more parameter to the parameter definition list.
 
-        """
-        # --------------------------------------------------
-        # Main Tab
-        self.pRigName = self.addParam("rig_name", "string", "rig")
-        self.pMode = self.addEnumParam("mode", ["Final", "WIP"], 0)
-        self.pStep = self.addEnumParam(
-            "step",
-            ["All Steps", "Objects", "Properties",
-                "Operators", "Connect", "Joints", "Finalize"],
-            6)
-        self.pIsModel = self.addParam("ismodel", "bool", True)
-        self.pClassicChannelNames = self.addParam(
-            "classicChannelNames",
-            "bool",
-            False)
-        self.pProxyChannels = self.addParam("proxyChannels", "bool", False)
-        self.pAttributePrefixUseCompName = self.addParam("attrPrefixName",
-                                                         "bool",
-                                                         False)
-        self.pWorldCtl = self.addParam("worldCtl", "bool", False)
-        self.pWorldCtl_name = self.addParam(
-            "world_ctl_name", "string", "world_ctl")
-
-        # --------------------------------------------------
-        # skin
-        self.pSkin = self.addParam("importSkin", "bool", False)
-        self.pSkinPackPath = self.addParam("skin", "string", "")
-
-        # --------------------------------------------------
-        # Colors
-
-        # Index color
-        self.pLColorIndexfk = self.addParam("L_color_fk", "long", 6, 0, 31)
-        self.pLColorIndexik = self.addParam("L_color_ik", "long", 18, 0, 31)
-        self.pRColorIndexfk = self.addParam("R_color_fk", "long", 23, 0, 31)
-        self.pRColorIndexik = self.addParam("R_color_ik", "long", 14, 0, 31)
-        self.pCColorIndexfk = self.addParam("C_color_fk", "long", 13, 0, 31)
-        self.pCColorIndexik = self.addParam("C_color_ik", "long", 17, 0, 31)
-
-        # RGB colors for Maya 2015 and up
-        # self.pLColorfk = self.addColorParam("L_RGB_fk", [0, 1, 0])
-        # self.pLColorik = self.addColorParam("L_RGB_ik", [0, .5, 0])
-        # self.pRColorfk = self.addColorParam("R_RGB_fk", [0, 0, 1])
-        # self.pRColorik = self.addColorParam("R_RGB_ik", [0, 0, .6])
-        # self.pCColorfk = self.addColorParam("C_RGB_fk", [1, 0, 0])
-        # self.pCColorik = self.addColorParam("C_RGB_ik", [.6, 0, 0])
-
-        # --------------------------------------------------
-        # Settings
-        self.pJointRig = self.addParam("joint_rig", "bool", True)
-        self.pJointRig = self.addParam("force_uniScale", "bool", True)
-        self.pSynoptic = self.addParam("synoptic", "string", "")
-
-        self.pDoPreCustomStep = self.addParam("doPreCustomStep", "bool", False)
-        self.pDoPostCustomStep = self.addParam("doPostCustomStep",
-                                               "bool", False)
-        self.pPreCustomStep = self.addParam("preCustomStep", "string", "")
-        self.pPostCustomStep = self.addParam("postCustomStep", "string", "")
-
-        # --------------------------------------------------
-        # Comments
-        self.pComments = self.addParam("comments", "string", "")
-        self.pUser = self.addParam("user", "string", getpass.getuser())
-        self.pDate = self.addParam(
-            "date", "string", str(datetime.datetime.now()))
-        self.pMayaVersion = self.addParam(
-            "maya_version", "string",
-            str(pm.mel.eval("getApplicationVersionAsFloat")))
-        self.pGearVersion = self.addParam(
-            "gear_version", "string", mgear.getVersion())
+        The parameters are created in a single pass from the _PARAM_SCHEMA
+        class definition.
 
-        # --------------------------------------------------
-        # Naming rules
-        self.p_ctl_name_rule = self.addParam("ctl_name_rule",
-                                             "string",
-                                             naming.DEFAULT_NAMING_RULE)
-
-        self.p_joint_name_rule = self.addParam("joint_name_rule",
-                                               "string",
-                                               naming.DEFAULT_NAMING_RULE)
-
-        self.p_side_left_name = self.addParam("side_left_name",
-                                              "string",
-                                              naming.DEFAULT_SIDE_L_NAME)
-
-        self.p_side_right_name = self.addParam("side_right_name",
-                                               "string",
-                                               naming.DEFAULT_SIDE_R_NAME)
-
-        self.p_side_center_name = self.addParam("side_center_name",
-                                                "string",
-                                                naming.DEFAULT_SIDE_C_NAME)
-        self.p_ctl_name_ext = self.addParam("ctl_name_ext",
-                                            "string",
-                                            naming.DEFAULT_CTL_EXT_NAME)
-        self.p_joint_name_ext = self.addParam("joint_name_ext",
-                                              "string",
-                                              naming.DEFAULT_JOINT_EXT_NAME)
-
-        self.p_ctl_des_letter_case = self.addEnumParam(
-            "ctl_description_letter_case",
-            ["Default", "Upper Case", "Lower Case", "Capitalization"],
-            0)
-        self.p_joint_des_letter_case = self.addEnumParam(
-            "joint_description_letter_case",
-            ["Default", "Upper Case", "Lower Case", "Capitalization"],
-            0)
+        """
+        maya_version, gear_version = _get_versions()
+        dynamic_values = {
+            "user": getpass.getuser(),
+            "date": str(datetime.datetime.now()),
+            "maya_version": maya_version,
+            "gear_version": gear_version}
+
+        paramDefs = {}
+        values = {}
+        paramNames = []
+        for param in self._PARAM_SCHEMA:
+            attrName, scriptName, valueType, value, extra = param
+            if value is None:
+                value = dynamic_values[scriptName]
+
+            if valueType == "enum":
+                paramDef = attribute.enumParamDef(
+                    scriptName, list(extra), value)
+            else:
+                minimum, maximum = extra or (None, None)
+                paramDef = attribute.ParamDef2(scriptName, valueType, value,
+                                               None, None, minimum, maximum,
+                                               False, True, True, True)
+            paramDefs[scriptName] = paramDef
+            values[scriptName] = value
+            paramNames.append(scriptName)
+            setattr(self, attrName, paramDef)
+
+        self.paramDefs.update(paramDefs)
+        self.values.update(values)
+        self.paramNames.extend(paramNames)
 
     def setFromSelection(self):
         """Set the guide hierarchy from selection."""
@@ -418,17 +615,21 @@ class Rig(Main):
             branch (bool): True to parse children components.
 
         """
-        startTime = datetime.datetime.now()
+        startTime = time.time()
         # Start
         mgear.log("Checking guide")
 
         # Get the model and the root
         self.model = root.getParent(generations=-1)
-        while True:
-            if root.hasAttr("comp_type") or self.model == root:
-                break
-            root = root.getParent()
-            mgear.log(root)
+        # walk up the root full path instead of querying each parent node
+        model_path = self.model.longName()
+        root_path = path = root.longName()
+        while path != model_path and not cmds.attributeQuery(
+                "comp_type", node=path, exists=True):
+            path = path.rsplit("|", 1)[0]
+            mgear.log(path)
+        if path != root_path:
+            root = pm.PyNode(path)
 
         # ---------------------------------------------------
         # First check and set the options
@@ -440,51 +641,66 @@ class Rig(Main):
         mgear.log("Get controllers")
         self.controllers_org = dag.findChild(self.model, "controllers_org")
         if self.controllers_org:
-            for child in self.controllers_org.getChildren():
-                self.controllers[child.name().split("|")[-1]] = child
+            children = cmds.listRelatives(
+                self.controllers_org.longName(), children=True,
+                fullPath=True) or []
+            for child in children:
+                self.controllers[child.rsplit("|", 1)[-1]] = pm.PyNode(child)
 
         # ---------------------------------------------------
         # Components
         mgear.log("Get components")
         self.findComponentRecursive(root, branch)
-        endTime = datetime.datetime.now()
-        finalTime = endTime - startTime
-        mgear.log("Find recursive in  [ " + str(finalTime) + " ]")
+        finalTime = time.time() - startTime
+        mgear.log("Find recursive in  [ %.3fs ]" % finalTime)
         # Parenting
         if self.valid:
+            # child components by the long name of their root parent. Only
+            # built if the fast approach fails.
+            parent_map = None
+            comps = self.components
             for name in self.componentsIndex:
                 mgear.log("Get parenting for: " + name)
                 # TODO: In the future should use connections to retrive this
                 # data
                 # We try the fastes aproach, will fail if is not the top node
+                comp_guide = comps[name]
                 try:
                     # search for his parent
-                    compParent = self.components[name].root.getParent()
+                    compParent = comp_guide.root.getParent()
                     if compParent and compParent.hasAttr("isGearGuide"):
 
-                        names = naming.get_component_and_relative_name(
+                        pName, pLocal = naming.get_component_and_relative_name(
                             compParent.name(long=None))
-                        pName = names[0]
-                        pLocal = names[1]
-                        pComp = self.components[pName]
-                        self.components[name].parentComponent = pComp
-                        self.components[name].parentLocalName = pLocal
+                        comp_guide.parentComponent = comps[pName]
+                        comp_guide.parentLocalName = pLocal
                 # This will scan the hierachy in reverse. It is much slower
                 except KeyError:
+                    if parent_map is None:
+                        parent_map = {}
+                        for childName in self.componentsIndex:
+                            compChild = comps[childName]
+                            compChild_parent = compChild.root.getParent()
+                            if compChild_parent:
+                                parent_map.setdefault(
+                                    compChild_parent.longName(),
+                                    []).append(compChild)
+
                     # search children and set him as parent
-                    compParent = self.components[name]
+                    compParent = comp_guide
                     # for localName, element in compParent.getObjects(
                     #         self.model, False).items():
                     # NOTE: getObjects3 is an experimental function
                     for localName, element in compParent.getObjects3(
                             self.model).items():
-                        for name in self.componentsIndex:
-                            compChild = self.components[name]
-                            compChild_parent = compChild.root.getParent()
-                            if (element is not None and
-                                    element == compChild_parent):
-                                compChild.parentComponent = compParent
-                                compChild.parentLocalName = localName
+                        if element is None:
+                            continue
+                        element_long = cmds.ls(element, long=True)
+                        if not element_long:
+                            continue
+                        for compChild in parent_map.get(element_long[0], []):
+                            compChild.parentComponent = compParent
+                            compChild.parentLocalName = localName
 
             # More option values
             self.addOptionsValues()
@@ -495,9 +711,8 @@ class Rig(Main):
                       "Check logged messages and update the guide.",
                       mgear.sev_warning)
 
-        endTime = datetime.datetime.now()
-        finalTime = endTime - startTime
-        mgear.log("Guide loaded from hierarchy in  [ " + str(finalTime) + " ]")
+        finalTime = time.time() - startTime
+        mgear.log("Guide loaded from hierarchy in  [ %.3fs ]" % finalTime)
 
     def set_from_dict(self, guide_template_dict):
 
@@ -546,29 +761,35 @@ class Rig(Main):
         # Components
         components_list = []
         components_dict = {}
+        comps = self.components
         for comp in self.componentsIndex:
-            comp_guide = self.components[comp]
+            comp_guide = comps[comp]
             c_name = comp_guide.fullName
             components_list.append(c_name)
             c_dict = comp_guide.get_guide_template_dict()
             components_dict[c_name] = c_dict
-            if c_dict["parent_fullName"]:
-                pn = c_dict["parent_fullName"]
+            pn = c_dict["parent_fullName"]
+            if pn:
                 components_dict[pn]["child_components"].append(c_name)
 
         self.guide_template_dict["components_list"] = components_list
         self.guide_template_dict["components_dict"] = components_dict
 
         # controls shape buffers
-        co = pm.ls("controllers_org")
+        # use the controllers_org found when the guide was set from the
+        # hierarchy instead of searching by name in the whole scene
+        co = getattr(self, "controllers_org", None)
+        if co is None:
+            co = dag.findChild(self.model, "controllers_org")
         # before only collected the exported components ctl buffers.
         # Now with the new naming rules will collect anything named
         # *_controlBuffer.
         # this way will include any control extracted. Not only from guides
         # components.
         # I.E: controls generated in customs steps
-        if co and co[0] in self.model.listRelatives(children=True):
-            ctl_buffers = co[0].listRelatives(children=True)
+        if co and co.getParent() == self.model:
+            from mgear.core import curve
+            ctl_buffers = co.listRelatives(children=True)
             exp_ctl_buffers = []
             for cb in ctl_buffers:
                 if cb.name().endswith("_controlBuffer"):
@@ -595,39 +816,53 @@ class Rig(Main):
 
         """
         # Get rig size to adapt size of object to the scale of the character
+        # The distance is measured from the origin, so we only need the
+        # longest squared length and a single square root at the end.
         maximum = 1
-        v = datatypes.Vector()
-        for comp in self.components.values():
-            for pos in comp.apos:
-                d = vector.getDistance(v, pos)
-                maximum = max(d, maximum)
+        sq_lengths = [p[0] * p[0] + p[1] * p[1] + p[2] * p[2]
+                      for comp in self.components.values()
+                      for p in comp.apos]
+        if sq_lengths:
+            maximum = max(math.sqrt(max(sq_lengths)), maximum)
 
         self.values["size"] = max(maximum * .05, .1)
 
     def findComponentRecursive(self, node, branch=True):
         """Finds components by recursive search.
 
+        Note:
+            The hierarchy is walked iteratively with maya.cmds using full
+            path names. The components are still found in depth first order
+            so componentsIndex keeps the hierarchy order.
+
         Arguments:
             node (dagNode): Object frome where start the search.
             branch (bool): If True search recursive all the children.
         """
 
-        if node.hasAttr("comp_type"):
-            comp_type = node.getAttr("comp_type")
-            comp_guide = self.getComponentGuide(comp_type)
+        stack = [node.longName()]
+        while stack:
+            path = stack.pop()
 
-            if comp_guide:
-                comp_guide.setFromHierarchy(node)
-                mgear.log(comp_guide.fullName + " (" + comp_type + ")")
-                if not comp_guide.valid:
-                    self.valid = False
+            if cmds.attributeQuery("comp_type", node=path, exists=True):
+                comp_type = cmds.getAttr(path + ".comp_type")
+                comp_guide = self.getComponentGuide(comp_type)
 
-                self.componentsIndex.append(comp_guide.fullName)
-                self.components[comp_guide.fullName] = comp_guide
+                if comp_guide:
+                    comp_guide.setFromHierarchy(pm.PyNode(path))
+                    mgear.log(comp_guide.fullName + " (" + comp_type + ")")
+                    if not comp_guide.valid:
+                        self.valid = False
 
-        if branch:
-            for child in node.getChildren(type="transform"):
-                self.findComponentRecursive(child)
+                    self.componentsIndex.append(comp_guide.fullName)
+                    self.components[comp_guide.fullName] = comp_guide
+
+            if branch:
+                children = cmds.listRelatives(
+                    path, children=True, type="transform", fullPath=True)
+                if children:
+                    # reversed so the first child is the next one visited
+                    stack.extend(reversed(children))
 
     def getComponentGuide(self, comp_type):
         """Get the componet guide python object
@@ -651,10 +886,13 @@ class Rig(Main):
         '''
 
         # Import module and get class
-        import mgear.shifter as shifter
-        module = shifter.importComponentGuide(comp_type)
+        ComponentGuide = _GUIDE_CLASS_CACHE.get(comp_type)
+        if ComponentGuide is None:
+            import mgear.shifter as shifter
+            module = shifter.importComponentGuide(comp_type)
 
-        ComponentGuide = getattr(module, "Guide")
+            ComponentGuide = getattr(module, "Guide")
+            _GUIDE_CLASS_CACHE[comp_type] = ComponentGuide
 
         return ComponentGuide()
 
@@ -785,6 +1023,10 @@ class Rig(Main):
                 partial = [partial]  # track the original partial components
             # clone list track all child partial
             partial_components = list(partial)
+            # sets for the membership checks. The list is kept since the
+            # order is returned
+            partial_set = set(partial)
+            partial_initial = set(partial)
 
         if initParent:
             if initParent and initParent.getParent(-1).hasAttr("ismodel"):
@@ -797,6 +1039,11 @@ class Rig(Main):
             self.initialHierarchy()
 
         # Components
+        # parents already resolved by name. False is stored for the names
+        # that can't be found, so the search is not repeated.
+        path_cache = {}
+        model_prefix = self.model.longName() + "|"
+
         pm.progressWindow(title='Drawing Guide Components',
                           progress=0,
                           max=len(self.components))
@@ -805,17 +1052,25 @@ class Rig(Main):
             comp_guide = self.components[name]
 
             if comp_guide.parentComponent:
-                try:
-                    parent = pm.PyNode(comp_guide.parentComponent.getName(
-                        comp_guide.parentLocalName))
-                except pm.MayaNodeError:
-                    # if we have a name clashing in the scene, it will try for
-                    # find the parent by crawling the hierarchy. This will take
-                    # longer time.
-                    parent = dag.findChild(
-                        self.model,
-                        comp_guide.parentComponent.getName(
-                            comp_guide.parentLocalName))
+                parent_name = comp_guide.parentComponent.getName(
+                    comp_guide.parentLocalName)
+                parent = path_cache.get(parent_name)
+                if parent is None:
+                    parent_paths = cmds.ls(parent_name, long=True)
+                    if len(parent_paths) > 1:
+                        # if we have a name clashing in the scene, keep only
+                        # the matches under the guide model.
+                        parent_paths = [p for p in parent_paths
+                                        if p.startswith(model_prefix)]
+                    if len(parent_paths) == 1:
+                        parent = pm.PyNode(parent_paths[0])
+                    elif parent_paths:
+                        # still ambiguous, it will try for find the parent by
+                        # crawling the hierarchy. This will take longer time.
+                        parent = dag.findChild(self.model, parent_name)
+                    else:
+                        parent = None
+                    path_cache[parent_name] = parent or False
             else:
                 parent = None
 
@@ -825,17 +1080,17 @@ class Rig(Main):
                 parent = self.model
 
             # Partial build logic
-            if partial and name in partial_components:
-                for chd in comp_guide.child_components:
-                    partial_components.append(chd)
+            if partial and name in partial_set:
+                partial_components.extend(comp_guide.child_components)
+                partial_set.update(comp_guide.child_components)
 
                 # need to reset the parent for partial build since will loop
                 # the guide from the root and will set again the parent to None
-                if name in partial and initParent:
+                if name in partial_initial and initParent:
                     # Check if component is in initial partial to reset the
                     # parent
                     parent = initParent
-                elif name in partial and not initParent:
+                elif name in partial_initial and not initParent:
                     parent = self.model
                 elif not parent and initParent:
                     parent = initParent
@@ -854,7 +1109,7 @@ class Rig(Main):
     def update(self, sel, force=False):
         """Update the guide if a parameter is missing"""
 
-        if pm.attributeQuery("ismodel", node=sel, ex=True):
+        if cmds.objExists(sel.name() + ".ismodel"):
             self.model = sel
         else:
             pm.displayWarning("select the top guide node")
@@ -892,50 +1147,63 @@ class Rig(Main):
             The guide have to be "Left" or "Right".
 
         """
-        if not pm.attributeQuery("comp_type", node=root, ex=True):
+        rn = root.name()
+        if not cmds.objExists(rn + ".comp_type"):
             mgear.log("Select a component root to duplicate", mgear.sev_error)
             return
 
         self.setFromHierarchy(root)
-        for name in self.componentsIndex:
-            comp_guide = self.components[name]
-            if symmetrize:
-                if not comp_guide.symmetrize():
+        # symmetrize all the components before drawing, so a failure
+        # doesn't leave a partially duplicated guide
+        if symmetrize:
+            for name in self.componentsIndex:
+                if not self.components[name].symmetrize():
                     return
 
         # Draw
-        if pm.attributeQuery("ismodel", node=root, ex=True):
+        if cmds.objExists(rn + ".ismodel"):
             self.draw()
 
         else:
+            # transforms under the model by name, to avoid crawling the
+            # hierarchy to find each parent. The new objects are added after
+            # each component is drawn.
+            name_index = {}
+            _index_transforms_by_name(name_index, self.model, False)
+            # mirrored names of the root parents, most components share few
+            rl_names = {}
 
             for name in self.componentsIndex:
                 comp_guide = self.components[name]
 
                 if comp_guide.parentComponent is None:
-                    parent = comp_guide.root.getParent()
+                    # the parent full path is read from the root full path
+                    root_parent_path = comp_guide.root.longName().rsplit(
+                        "|", 1)[0]
+                    parent_path = None
                     if symmetrize:
-                        parent = dag.findChild(
-                            self.model,
-                            string.convertRLName(
-                                comp_guide.root.getParent().name()))
-                        if not parent:
-                            parent = comp_guide.root.getParent()
-
-                    else:
-                        parent = comp_guide.root.getParent()
+                        leaf = root_parent_path.rsplit("|", 1)[-1]
+                        rl_name = rl_names.get(leaf)
+                        if rl_name is None:
+                            rl_name = rl_names[leaf] = string.convertRLName(
+                                leaf)
+                        parent_path = name_index.get(rl_name)
+                    if not parent_path:
+                        parent_path = root_parent_path
+                    parent = pm.PyNode(parent_path) if parent_path else None
 
                 else:
-                    parent = dag.findChild(
-                        self.model,
-                        comp_guide.parentComponent.getName(
-                            comp_guide.parentLocalName))
+                    parent_comp = comp_guide.parentComponent
+                    parent_local_name = comp_guide.parentLocalName
+                    parent_path = name_index.get(
+                        parent_comp.getName(parent_local_name))
+                    parent = pm.PyNode(parent_path) if parent_path else None
                     if not parent:
                         mgear.log(
                             "Unable to find parent (%s.%s) for guide %s" %
-                            (comp_guide.parentComponent.getFullName,
-                                comp_guide.parentLocalName,
-                                comp_guide.getFullName))
+                            (parent_comp.getFullName(),
+                                parent_local_name,
+                                comp_guide.getFullName()))
                         parent = self.model
 
                 # Reset the root so we force the draw to duplicate
@@ -944,6 +1212,7 @@ class Rig(Main):
                 comp_guide.setIndex(self.model)
 
                 comp_guide.draw(parent)
+                _index_transforms_by_name(name_index, comp_guide.root)
 
         pm.select(self.components[self.componentsIndex[0]].root)
 
@@ -957,7 +1226,7 @@ class Rig(Main):
             newIndex (str): New index of the component
         """
 
-        if not pm.attributeQuery("comp_type", node=root, ex=True):
+        if not cmds.objExists(root.name() + ".comp_type"):
             mgear.log("Select a root to edit properties", mgear.sev_error)
             return
         self.setFromHierarchy(root, False)
@@ -967,6 +1236,75 @@ class Rig(Main):
         comp_guide.rename(root, newName, newSide, newIndex)
 
 
+def _index_transforms_by_name(index, root, include_root=True):
+    """Add the full path of the transforms of a hierarchy to a name index.
+
+    If several transforms have the same name, the first one indexed is kept.
+
+    Arguments:
+        index (dict): Full paths by short name. Updated in place.
+        root (dagNode): The root of the hierarchy to index.
+        include_root (bool): If True, the root is also indexed.
+    """
+    rootPath = root.longName()
+    paths = cmds.listRelatives(
+        rootPath, allDescendents=True, type="transform", fullPath=True) or []
+    # allDescendents lists the children after their descendants
+    paths.reverse()
+    if include_root:
+        paths.insert(0, rootPath)
+    for path in paths:
+        index.setdefault(path.rsplit("|", 1)[-1], path)
+
+
+def _items_text(listWidget):
+    """Get the text of all the items of a list widget.
+
+    Arguments:
+        listWidget (QListWidget): The list widget.
+
+    Returns:
+        list of str: The items text, in the list order.
+    """
+    return [listWidget.item(i).text() for i in range(listWidget.count())]
+
+
+def _split_attr(value):
+    """Split a comma separated string attribute value.
+
+    Arguments:
+        value (str): The attribute value.
+
+    Returns:
+        list of str: The non empty values. An empty attribute gives an
+            empty list instead of [""].
+    """
+    return [v for v in value.split(",") if v]
+
+
+def _snapshot_attrs(root, names):
+    """Read the values of several attributes of the same node.
+
+    Uses maya.cmds to avoid creating a pymel Attribute for each read.
+
+    Arguments:
+        root (dagNode): The node with the attributes.
+        names (list of str): The attributes names.
+
+    Returns:
+        dict: The attributes values by name.
+    """
+    rootName = root.name()
+    values = {}
+    for name in names:
+        value = cmds.getAttr(rootName + "." + name)
+        # cmds returns None for the empty string attributes
+        if value is None:
+            value = ""
+        values[name] = value
+    return values
+
+
 class HelperSlots(object):
 
     def updateHostUI(self, lEdit, targetAttr):
@@ -1022,30 +1360,31 @@ class HelperSlots(object):
     def addItem2listWidget(self, listWidget, targetAttr=None):
 
         items = pm.selected()
-        itemsList = [i.text() for i in listWidget.findItems(
-            "", QtCore.Qt.MatchContains)]
         # Quick clean the first empty item
-        if itemsList and not itemsList[0]:
+        if listWidget.count() and not listWidget.item(0).text():
             listWidget.takeItem(0)
+        itemsList = set(_items_text(listWidget))
 
         for item in items:
-            if len(item.name().split("|")) != 1:
+            name = item.name()
+            if "|" in name:
                 pm.displayWarning("Not valid obj: %s, name is not unique." %
-                                  item.name())
+                                  name)
                 continue
 
-            if item.name() not in itemsList:
+            if name not in itemsList:
                 if item.hasAttr("isGearGuide"):
-                    listWidget.addItem(item.name())
+                    listWidget.addItem(name)
+                    itemsList.add(name)
 
                 else:
                     pm.displayWarning(
                         "The object: %s, is not a valid"
                         " reference, Please select only guide componet"
-                        " roots and guide locators." % item.name())
+                        " roots and guide locators." % name)
             else:
                 pm.displayWarning("The object: %s, is already in the list." %
-                                  item.name())
+                                  name)
 
         if targetAttr:
             self.updateListAttr(listWidget, targetAttr)
@@ -1059,33 +1398,41 @@ class HelperSlots(object):
     def moveFromListWidget2ListWidget(self, sourceListWidget, targetListWidget,
                                       targetAttrListWidget, targetAttr=None):
         # Quick clean the first empty item
-        itemsList = [i.text() for i in targetAttrListWidget.findItems(
-            "", QtCore.Qt.MatchContains)]
-        if itemsList and not itemsList[0]:
+        if (targetAttrListWidget.count()
+                and not targetAttrListWidget.item(0).text()):
             targetAttrListWidget.takeItem(0)
 
-        for item in sourceListWidget.selectedItems():
-            targetListWidget.addItem(item.text())
-            sourceListWidget.takeItem(sourceListWidget.row(item))
+        # the list attribute is updated once at the end
+        self._bulk_edit = True
+        try:
+            for item in sourceListWidget.selectedItems():
+                targetListWidget.addItem(item.text())
+                sourceListWidget.takeItem(sourceListWidget.row(item))
+        finally:
+            self._bulk_edit = False
 
         if targetAttr:
             self.updateListAttr(targetAttrListWidget, targetAttr)
 
     def copyFromListWidget(self, sourceListWidget, targetListWidget,
                            targetAttr=None):
-        targetListWidget.clear()
-        itemsList = [i.text() for i in sourceListWidget.findItems(
-            "", QtCore.Qt.MatchContains)]
-        for item in itemsList:
-            targetListWidget.addItem(item)
+        self._bulk_edit = True
+        try:
+            targetListWidget.clear()
+            targetListWidget.addItems(_items_text(sourceListWidget))
+        finally:
+            self._bulk_edit = False
         if targetAttr:
             self.updateListAttr(sourceListWidget, targetAttr)
 
     def updateListAttr(self, sourceListWidget, targetAttr):
         """Update the string attribute with values separated by commas"""
-        newValue = ",".join([i.text() for i in sourceListWidget.findItems(
-            "", QtCore.Qt.MatchContains)])
-        self.root.attr(targetAttr).set(newValue)
+        newValue = ",".join(sourceListWidget.item(i).text()
+                            for i in range(sourceListWidget.count()))
+        plug = self._rootPlug(targetAttr)
+        # cmds returns None for the empty string attributes
+        if newValue != (cmds.getAttr(plug) or ""):
+            cmds.setAttr(plug, newValue, type="string")
 
     def updateComponentName(self):
 
@@ -1111,23 +1458,31 @@ class HelperSlots(object):
         self.root.attr("connector").set(itemsList[sourceWidget.currentIndex()])
 
     def populateCheck(self, targetWidget, sourceAttr, *args):
-        if self.root.attr(sourceAttr).get():
+        self.populateCheckValue(targetWidget, self.root.attr(sourceAttr).get())
+
+    def populateCheckValue(self, targetWidget, value):
+        if value:
             targetWidget.setCheckState(QtCore.Qt.Checked)
         else:
             targetWidget.setCheckState(QtCore.Qt.Unchecked)
 
+    def _rootPlug(self, targetAttr):
+        # the name is not cached since the root can be renamed
+        return self.root.name() + "." + targetAttr
+
     def updateCheck(self, sourceWidget, targetAttr, *args):
-        self.root.attr(targetAttr).set(sourceWidget.isChecked())
+        cmds.setAttr(self._rootPlug(targetAttr), sourceWidget.isChecked())
 
     def updateSpinBox(self, sourceWidget, targetAttr, *args):
-        self.root.attr(targetAttr).set(sourceWidget.value())
+        cmds.setAttr(self._rootPlug(targetAttr), sourceWidget.value())
         return True
 
     def updateSlider(self, sourceWidget, targetAttr, *args):
-        self.root.attr(targetAttr).set(float(sourceWidget.value()) / 100)
+        cmds.setAttr(self._rootPlug(targetAttr),
+                     float(sourceWidget.value()) / 100)
 
     def updateComboBox(self, sourceWidget, targetAttr, *args):
-        self.root.attr(targetAttr).set(sourceWidget.currentIndex())
+        cmds.setAttr(self._rootPlug(targetAttr), sourceWidget.currentIndex())
 
     def updateControlShape(self, sourceWidget, ctlList, targetAttr, *args):
         curIndx = sourceWidget.currentIndex()
@@ -1142,11 +1497,10 @@ class HelperSlots(object):
         pyqt.deleteInstances(self, MayaQDockWidget)
 
     def get_cs_file_fullpath(self, cs_data):
-        filepath = cs_data.split("|")[-1][1:]
-        if os.environ.get(MGEAR_SHIFTER_CUSTOMSTEP_KEY, ""):
-            fullpath = os.path.join(
-                os.environ.get(
-                    MGEAR_SHIFTER_CUSTOMSTEP_KEY, ""), filepath)
+        filepath = cs_data.rpartition("|")[2][1:]
+        cs_root = os.environ.get(MGEAR_SHIFTER_CUSTOMSTEP_KEY, "")
+        if cs_root:
+            fullpath = os.path.join(cs_root, filepath)
         else:
             fullpath = filepath
 
@@ -1158,12 +1512,7 @@ class HelperSlots(object):
             fullpath = self.get_cs_file_fullpath(cs_data)
 
             if fullpath:
-                if sys.platform.startswith('darwin'):
-                    subprocess.call(('open', fullpath))
-                elif os.name == 'nt':
-                    os.startfile(fullpath)
-                elif os.name == 'posix':
-                    subprocess.call(('xdg-open', fullpath))
+                _open_file(fullpath)
             else:
                 pm.displayWarning("Please select one item from the list")
         except Exception:
@@ -1214,11 +1563,18 @@ class HelperSlots(object):
     def get_steps_dict(self, itemsList):
         stepsDict = {}
         stepsDict["itemsList"] = itemsList
-        for item in itemsList:
-            step = open(item, "r")
-            data = step.read()
-            stepsDict[item] = data
-            step.close()
+        if len(itemsList) > 1:
+            # the steps are often on network drives, read them in parallel
+            from multiprocessing.pool import ThreadPool
+            pool = ThreadPool(min(8, len(itemsList)))
+            try:
+                sources = pool.map(_read_file, itemsList)
+            finally:
+                pool.close()
+                pool.join()
+        else:
+            sources = [_read_file(item) for item in itemsList]
+        stepsDict.update(zip(itemsList, sources))
 
         return stepsDict
 
@@ -1232,16 +1588,15 @@ class HelperSlots(object):
                 if sys.platform.startswith('darwin'):
                     stepPath = stepPath.replace('\\', '/')
 
-                fileName = os.path.split(stepPath)[1].split(".")[0]
+                fileName = _stem(stepPath)
 
-                if os.environ.get(MGEAR_SHIFTER_CUSTOMSTEP_KEY, ""):
-                    runPath = os.path.join(
-                        os.environ.get(
-                            MGEAR_SHIFTER_CUSTOMSTEP_KEY, ""), stepPath)
+                cs_root = os.environ.get(MGEAR_SHIFTER_CUSTOMSTEP_KEY, "")
+                if cs_root:
+                    runPath = os.path.join(cs_root, stepPath)
                 else:
                     runPath = stepPath
 
-                customStep = imp.load_source(fileName, runPath)
+                customStep = _load_step_module(fileName, runPath)
                 if hasattr(customStep, "CustomShifterStep"):
                     argspec = inspect.getargspec(customStep.CustomShifterStep.__init__)
                     if "stored_dict" in argspec.args:
@@ -1261,11 +1616,12 @@ class HelperSlots(object):
                         "Succeed!!" % stepPath)
 
         except Exception as ex:
-            template = "An exception of type {0} occurred. "
-            "Arguments:\n{1!r}"
+            template = ("An exception of type {0} occurred. "
+                        "Arguments:\n{1!r}")
             message = template.format(type(ex).__name__, ex.args)
+            tb = traceback.format_exc()
             pm.displayError(message)
-            pm.displayError(traceback.format_exc())
+            pm.displayError(tb)
             cont = pm.confirmBox(
                 "FAIL: Custom Step Fail",
                 "The step:%s has failed. Continue with next step?"
@@ -1273,7 +1629,7 @@ class HelperSlots(object):
                 "\n\n" +
                 message +
                 "\n\n" +
-                traceback.format_exc(),
+                tb,
                 "Continue", "Stop Build", "Try Again!")
             if cont == "Stop Build":
                 # stop Build
@@ -1293,7 +1649,8 @@ class HelperSlots(object):
     def runManualStep(self, widgetList):
         selItems = widgetList.selectedItems()
         for item in selItems:
-            self.runStep(item.text().split("|")[-1][1:], customStepDic={})
+            self.runStep(item.text().rpartition("|")[2][1:],
+                         customStepDic={})
 
 
 class GuideSettingsTab(QtWidgets.QDialog, guui.Ui_Form):
@@ -1329,6 +1686,23 @@ class GuideSettings(MayaQWidgetDockableMixin, QtWidgets.QDialog, HelperSlots):
     whiteDownBrush.setColor('#E2E2E2')
     orangeBrush = QtGui.QBrush()
     orangeBrush.setColor('#e67e22')
+    # custom steps search highlight
+    _searchMatchColor = QtGui.QColor(128, 128, 128, 255)
+    _searchClearColor = QtGui.QColor(255, 255, 255, 0)
+
+    # attributes read to populate the controls
+    _POPULATE_ATTRS = ("rig_name", "mode", "step", "proxyChannels",
+                       "worldCtl", "world_ctl_name", "classicChannelNames",
+                       "attrPrefixName", "importSkin", "skin", "joint_rig",
+                       "force_uniScale", "synoptic",
+                       "L_color_fk", "L_color_ik", "C_color_fk",
+                       "C_color_ik", "R_color_fk", "R_color_ik",
+                       "doPreCustomStep", "preCustomStep",
+                       "doPostCustomStep", "postCustomStep")
+    _NAMING_ATTRS = ("ctl_name_rule", "joint_name_rule", "side_left_name",
+                     "side_right_name", "side_center_name", "ctl_name_ext",
+                     "joint_name_ext", "ctl_description_letter_case",
+                     "joint_description_letter_case")
 
     def __init__(self, parent=None):
         self.toolName = TYPE
@@ -1339,6 +1713,8 @@ class GuideSettings(MayaQWidgetDockableMixin, QtWidgets.QDialog, HelperSlots):
         # the inspectSettings function set the current selection to the
         # component root before open the settings dialog
         self.root = pm.selected()[0]
+        # set while moving items between list widgets
+        self._bulk_edit = False
 
         self.guideSettingsTab = guideSettingsTab()
         self.customStepTab = customStepTab()
@@ -1361,6 +1737,10 @@ class GuideSettings(MayaQWidgetDockableMixin, QtWidgets.QDialog, HelperSlots):
         self.post_cs.setMouseTracking(True)
         self.post_cs.entered.connect(self.post_info)
 
+        # custom steps search
+        self.pre_search = self.customStepTab.preSearch_lineEdit
+        self.post_search = self.customStepTab.postSearch_lineEdit
+
     def pre_info(self, index):
         self.hover_info_item_entered(self.pre_cs, index)
 
@@ -1402,95 +1782,79 @@ class GuideSettings(MayaQWidgetDockableMixin, QtWidgets.QDialog, HelperSlots):
         self.tabs.insertTab(1, self.customStepTab, "Custom Steps")
         self.tabs.insertTab(2, self.namingRulesTab, "Naming Rules")
 
+        # read all the attributes at once
+        attrs = _snapshot_attrs(self.root, self._POPULATE_ATTRS)
+
         # populate main settings
-        self.guideSettingsTab.rigName_lineEdit.setText(
-            self.root.attr("rig_name").get())
-        self.guideSettingsTab.mode_comboBox.setCurrentIndex(
-            self.root.attr("mode").get())
-        self.guideSettingsTab.step_comboBox.setCurrentIndex(
-            self.root.attr("step").get())
-        self.populateCheck(
-            self.guideSettingsTab.proxyChannels_checkBox, "proxyChannels")
-
-        self.populateCheck(self.guideSettingsTab.worldCtl_checkBox, "worldCtl")
-        self.guideSettingsTab.worldCtl_lineEdit.setText(
-            self.root.attr("world_ctl_name").get())
-
-        self.populateCheck(
-            self.guideSettingsTab.classicChannelNames_checkBox,
-            "classicChannelNames")
-        self.populateCheck(
-            self.guideSettingsTab.attrPrefix_checkBox,
-            "attrPrefixName")
-        self.populateCheck(
-            self.guideSettingsTab.importSkin_checkBox, "importSkin")
-        self.guideSettingsTab.skin_lineEdit.setText(
-            self.root.attr("skin").get())
-        self.populateCheck(
-            self.guideSettingsTab.jointRig_checkBox, "joint_rig")
-        self.populateCheck(
-            self.guideSettingsTab.force_uniScale_checkBox, "force_uniScale")
+        tap = self.guideSettingsTab
+        tap.rigName_lineEdit.setText(attrs["rig_name"])
+        tap.mode_comboBox.setCurrentIndex(attrs["mode"])
+        tap.step_comboBox.setCurrentIndex(attrs["step"])
+        self.populateCheckValue(
+            tap.proxyChannels_checkBox, attrs["proxyChannels"])
+
+        self.populateCheckValue(tap.worldCtl_checkBox, attrs["worldCtl"])
+        tap.worldCtl_lineEdit.setText(attrs["world_ctl_name"])
+
+        self.populateCheckValue(
+            tap.classicChannelNames_checkBox, attrs["classicChannelNames"])
+        self.populateCheckValue(
+            tap.attrPrefix_checkBox, attrs["attrPrefixName"])
+        self.populateCheckValue(
+            tap.importSkin_checkBox, attrs["importSkin"])
+        tap.skin_lineEdit.setText(attrs["skin"])
+        self.populateCheckValue(
+            tap.jointRig_checkBox, attrs["joint_rig"])
+        self.populateCheckValue(
+            tap.force_uniScale_checkBox, attrs["force_uniScale"])
         self.populateAvailableSynopticTabs()
 
-        for item in self.root.attr("synoptic").get().split(","):
-            self.guideSettingsTab.rigTabs_listWidget.addItem(item)
-
-        self.guideSettingsTab.L_color_fk_spinBox.setValue(
-            self.root.attr("L_color_fk").get())
-        self.guideSettingsTab.L_color_ik_spinBox.setValue(
-            self.root.attr("L_color_ik").get())
-        self.guideSettingsTab.C_color_fk_spinBox.setValue(
-            self.root.attr("C_color_fk").get())
-        self.guideSettingsTab.C_color_ik_spinBox.setValue(
-            self.root.attr("C_color_ik").get())
-        self.guideSettingsTab.R_color_fk_spinBox.setValue(
-            self.root.attr("R_color_fk").get())
-        self.guideSettingsTab.R_color_ik_spinBox.setValue(
-            self.root.attr("R_color_ik").get())
+        tap.rigTabs_listWidget.addItems(_split_attr(attrs["synoptic"]))
+
+        tap.L_color_fk_spinBox.setValue(attrs["L_color_fk"])
+        tap.L_color_ik_spinBox.setValue(attrs["L_color_ik"])
+        tap.C_color_fk_spinBox.setValue(attrs["C_color_fk"])
+        tap.C_color_ik_spinBox.setValue(attrs["C_color_ik"])
+        tap.R_color_fk_spinBox.setValue(attrs["R_color_fk"])
+        tap.R_color_ik_spinBox.setValue(attrs["R_color_ik"])
 
         # pupulate custom steps sttings
-        self.populateCheck(
-            self.customStepTab.preCustomStep_checkBox, "doPreCustomStep")
-        for item in self.root.attr("preCustomStep").get().split(","):
-            self.customStepTab.preCustomStep_listWidget.addItem(item)
-        self.refreshStatusColor(self.customStepTab.preCustomStep_listWidget)
-
-        self.populateCheck(
-            self.customStepTab.postCustomStep_checkBox, "doPostCustomStep")
-        for item in self.root.attr("postCustomStep").get().split(","):
-            self.customStepTab.postCustomStep_listWidget.addItem(item)
-        self.refreshStatusColor(self.customStepTab.postCustomStep_listWidget)
+        csTap = self.customStepTab
+        self.populateCheckValue(
+            csTap.preCustomStep_checkBox, attrs["doPreCustomStep"])
+        csTap.preCustomStep_listWidget.addItems(
+            _split_attr(attrs["preCustomStep"]))
+        self.refreshStatusColor(csTap.preCustomStep_listWidget)
+
+        self.populateCheckValue(
+            csTap.postCustomStep_checkBox, attrs["doPostCustomStep"])
+        csTap.postCustomStep_listWidget.addItems(
+            _split_attr(attrs["postCustomStep"]))
+        self.refreshStatusColor(csTap.postCustomStep_listWidget)
 
         self.populate_naming_controls()
 
     def populate_naming_controls(self):
         # populate name settings
-        self.namingRulesTab.ctl_name_rule_lineEdit.setText(
-            self.root.attr("ctl_name_rule").get())
-        self.naming_rule_validator(
-            self.namingRulesTab.ctl_name_rule_lineEdit)
-        self.namingRulesTab.joint_name_rule_lineEdit.setText(
-            self.root.attr("joint_name_rule").get())
-        self.naming_rule_validator(
-            self.namingRulesTab.joint_name_rule_lineEdit)
+        attrs = _snapshot_attrs(self.root, self._NAMING_ATTRS)
+        tap = self.namingRulesTab
+        tap.ctl_name_rule_lineEdit.setText(attrs["ctl_name_rule"])
+        self.naming_rule_validator(tap.ctl_name_rule_lineEdit)
+        tap.joint_name_rule_lineEdit.setText(attrs["joint_name_rule"])
+        self.naming_rule_validator(tap.joint_name_rule_lineEdit)
 
-        self.namingRulesTab.side_left_name_lineEdit.setText(
-            self.root.attr("side_left_name").get())
-        self.namingRulesTab.side_right_name_lineEdit.setText(
-            self.root.attr("side_right_name").get())
-        self.namingRulesTab.side_center_name_lineEdit.setText(
-            self.root.attr("side_center_name").get())
+        tap.side_left_name_lineEdit.setText(attrs["side_left_name"])
+        tap.side_right_name_lineEdit.setText(attrs["side_right_name"])
+        tap.side_center_name_lineEdit.setText(attrs["side_center_name"])
 
-        self.namingRulesTab.ctl_name_ext_lineEdit.setText(
-            self.root.attr("ctl_name_ext").get())
-        self.namingRulesTab.joint_name_ext_lineEdit.setText(
-            self.root.attr("joint_name_ext").get())
+        tap.ctl_name_ext_lineEdit.setText(attrs["ctl_name_ext"])
+        tap.joint_name_ext_lineEdit.setText(attrs["joint_name_ext"])
 
-        self.namingRulesTab.ctl_des_letter_case_comboBox.setCurrentIndex(
-            self.root.attr("ctl_description_letter_case").get())
+        tap.ctl_des_letter_case_comboBox.setCurrentIndex(
+            attrs["ctl_description_letter_case"])
 
-        self.namingRulesTab.joint_des_letter_case_comboBox.setCurrentIndex(
-            self.root.attr("joint_description_letter_case").get())
+        tap.joint_des_letter_case_comboBox.setCurrentIndex(
+            attrs["joint_description_letter_case"])
 
     def create_layout(self):
         """
@@ -1507,52 +1871,39 @@ class GuideSettings(MayaQWidgetDockableMixin, QtWidgets.QDialog, HelperSlots):
         """Create the slots connections to the controls functions"""
         self.close_button.clicked.connect(self.close_settings)
 
+        # list widgets filtered by eventFilter and the attr they update
+        self._list_attr_map = {
+            id(self.guideSettingsTab.rigTabs_listWidget): "synoptic",
+            id(self.customStepTab.preCustomStep_listWidget): "preCustomStep",
+            id(self.customStepTab.postCustomStep_listWidget):
+                "postCustomStep"}
+
         # Setting Tab
         tap = self.guideSettingsTab
         tap.rigName_lineEdit.editingFinished.connect(
             partial(self.updateLineEdit,
                     tap.rigName_lineEdit,
                     "rig_name"))
-        tap.mode_comboBox.currentIndexChanged.connect(
-            partial(self.updateComboBox,
-                    tap.mode_comboBox,
-                    "mode"))
-        tap.step_comboBox.currentIndexChanged.connect(
-            partial(self.updateComboBox,
-                    tap.step_comboBox,
-                    "step"))
-        tap.proxyChannels_checkBox.stateChanged.connect(
-            partial(self.updateCheck,
-                    tap.proxyChannels_checkBox,
-                    "proxyChannels"))
-        tap.worldCtl_checkBox.stateChanged.connect(
-            partial(self.updateCheck,
-                    tap.worldCtl_checkBox,
-                    "worldCtl"))
+        self.connectAttrWidgets((
+            (tap.mode_comboBox, "mode"),
+            (tap.step_comboBox, "step"),
+            (tap.proxyChannels_checkBox, "proxyChannels"),
+            (tap.worldCtl_checkBox, "worldCtl"),
+            (tap.classicChannelNames_checkBox, "classicChannelNames"),
+            (tap.attrPrefix_checkBox, "attrPrefixName"),
+            (tap.importSkin_checkBox, "importSkin"),
+            (tap.jointRig_checkBox, "joint_rig"),
+            (tap.force_uniScale_checkBox, "force_uniScale"),
+            (tap.L_color_fk_spinBox, "L_color_fk"),
+            (tap.L_color_ik_spinBox, "L_color_ik"),
+            (tap.C_color_fk_spinBox, "C_color_fk"),
+            (tap.C_color_ik_spinBox, "C_color_ik"),
+            (tap.R_color_fk_spinBox, "R_color_fk"),
+            (tap.R_color_ik_spinBox, "R_color_ik")))
         tap.worldCtl_lineEdit.editingFinished.connect(
             partial(self.updateLineEdit2,
                     tap.worldCtl_lineEdit,
                     "world_ctl_name"))
-        tap.classicChannelNames_checkBox.stateChanged.connect(
-            partial(self.updateCheck,
-                    tap.classicChannelNames_checkBox,
-                    "classicChannelNames"))
-        tap.attrPrefix_checkBox.stateChanged.connect(
-            partial(self.updateCheck,
-                    tap.attrPrefix_checkBox,
-                    "attrPrefixName"))
-        tap.importSkin_checkBox.stateChanged.connect(
-            partial(self.updateCheck,
-                    tap.importSkin_checkBox,
-                    "importSkin"))
-        tap.jointRig_checkBox.stateChanged.connect(
-            partial(self.updateCheck,
-                    tap.jointRig_checkBox,
-                    "joint_rig"))
-        tap.force_uniScale_checkBox.stateChanged.connect(
-            partial(self.updateCheck,
-                    tap.force_uniScale_checkBox,
-                    "force_uniScale"))
         tap.addTab_pushButton.clicked.connect(
             partial(self.moveFromListWidget2ListWidget,
                     tap.available_listWidget,
@@ -1569,37 +1920,11 @@ class GuideSettings(MayaQWidgetDockableMixin, QtWidgets.QDialog, HelperSlots):
             self.skinLoad)
         tap.rigTabs_listWidget.installEventFilter(self)
 
-        tap.L_color_fk_spinBox.valueChanged.connect(
-            partial(self.updateSpinBox,
-                    tap.L_color_fk_spinBox,
-                    "L_color_fk"))
-        tap.L_color_ik_spinBox.valueChanged.connect(
-            partial(self.updateSpinBox,
-                    tap.L_color_ik_spinBox,
-                    "L_color_ik"))
-        tap.C_color_fk_spinBox.valueChanged.connect(
-            partial(self.updateSpinBox,
-                    tap.C_color_fk_spinBox,
-                    "C_color_fk"))
-        tap.C_color_ik_spinBox.valueChanged.connect(
-            partial(self.updateSpinBox,
-                    tap.C_color_ik_spinBox,
-                    "C_color_ik"))
-        tap.R_color_fk_spinBox.valueChanged.connect(
-            partial(self.updateSpinBox,
-                    tap.R_color_fk_spinBox,
-                    "R_color_fk"))
-        tap.R_color_ik_spinBox.valueChanged.connect(
-            partial(self.updateSpinBox,
-                    tap.R_color_ik_spinBox,
-                    "R_color_ik"))
-
         # custom Step Tab
         csTap = self.customStepTab
-        csTap.preCustomStep_checkBox.stateChanged.connect(
-            partial(self.updateCheck,
-                    csTap.preCustomStep_checkBox,
-                    "doPreCustomStep"))
+        self.connectAttrWidgets((
+            (csTap.preCustomStep_checkBox, "doPreCustomStep"),
+            (csTap.postCustomStep_checkBox, "doPostCustomStep")))
         csTap.preCustomStepAdd_pushButton.clicked.connect(
             self.addCustomStep)
         csTap.preCustomStepNew_pushButton.clicked.connect(
@@ -1622,10 +1947,6 @@ class GuideSettings(MayaQWidgetDockableMixin, QtWidgets.QDialog, HelperSlots):
             partial(self.editFile,
                     csTap.preCustomStep_listWidget))
 
-        csTap.postCustomStep_checkBox.stateChanged.connect(
-            partial(self.updateCheck,
-                    csTap.postCustomStep_checkBox,
-                    "doPostCustomStep"))
         csTap.postCustomStepAdd_pushButton.clicked.connect(
             partial(self.addCustomStep, False))
         csTap.postCustomStepNew_pushButton.clicked.connect(
@@ -1649,6 +1970,11 @@ class GuideSettings(MayaQWidgetDockableMixin, QtWidgets.QDialog, HelperSlots):
                     csTap.postCustomStep_listWidget))
 
         # right click menus
+        self._csMenus = {
+            "preCustomStep": self._buildCustomStepMenu(
+                csTap.preCustomStep_listWidget, "preCustomStep"),
+            "postCustomStep": self._buildCustomStepMenu(
+                csTap.postCustomStep_listWidget, "postCustomStep")}
         csTap.preCustomStep_listWidget.setContextMenuPolicy(
             QtCore.Qt.CustomContextMenu)
         csTap.preCustomStep_listWidget.customContextMenuRequested.connect(
@@ -1702,14 +2028,10 @@ class GuideSettings(MayaQWidgetDockableMixin, QtWidgets.QDialog, HelperSlots):
                     "joint_name_ext"))
 
         # description letter case
-        tap.ctl_des_letter_case_comboBox.currentIndexChanged.connect(
-            partial(self.updateComboBox,
-                    tap.ctl_des_letter_case_comboBox,
-                    "ctl_description_letter_case"))
-        tap.joint_des_letter_case_comboBox.currentIndexChanged.connect(
-            partial(self.updateComboBox,
-                    tap.joint_des_letter_case_comboBox,
-                    "joint_description_letter_case"))
+        self.connectAttrWidgets((
+            (tap.ctl_des_letter_case_comboBox, "ctl_description_letter_case"),
+            (tap.joint_des_letter_case_comboBox,
+             "joint_description_letter_case")))
 
         # reset naming rules
         tap.reset_ctl_name_rule_pushButton.clicked.connect(
@@ -1737,14 +2059,44 @@ class GuideSettings(MayaQWidgetDockableMixin, QtWidgets.QDialog, HelperSlots):
         tap.save_naming_configuration_pushButton.clicked.connect(
             self.export_name_config)
 
+    def connectAttrWidgets(self, widgets):
+        """Connect the widgets to the guide attributes they update.
+
+        The attribute name is stored in the "targetAttr" property of the
+        widget, so all the widgets of the same type share one slot.
+
+        Arguments:
+            widgets (list): (widget, attribute name) pairs.
+        """
+        for widget, targetAttr in widgets:
+            widget.setProperty("targetAttr", targetAttr)
+            if isinstance(widget, QtWidgets.QCheckBox):
+                widget.stateChanged.connect(self.updateCheckFromSender)
+            elif isinstance(widget, QtWidgets.QComboBox):
+                widget.currentIndexChanged.connect(
+                    self.updateComboBoxFromSender)
+            else:
+                widget.valueChanged.connect(self.updateSpinBoxFromSender)
+
+    def updateCheckFromSender(self, *args):
+        widget = self.sender()
+        self.updateCheck(widget, widget.property("targetAttr"))
+
+    def updateSpinBoxFromSender(self, *args):
+        widget = self.sender()
+        self.updateSpinBox(widget, widget.property("targetAttr"))
+
+    def updateComboBoxFromSender(self, *args):
+        widget = self.sender()
+        self.updateComboBox(widget, widget.property("targetAttr"))
+
     def eventFilter(self, sender, event):
         if event.type() == QtCore.QEvent.ChildRemoved:
-            if sender == self.guideSettingsTab.rigTabs_listWidget:
-                self.updateListAttr(sender, "synoptic")
-            elif sender == self.customStepTab.preCustomStep_listWidget:
-                self.updateListAttr(sender, "preCustomStep")
-            elif sender == self.customStepTab.postCustomStep_listWidget:
-                self.updateListAttr(sender, "postCustomStep")
+            if self._bulk_edit:
+                return True
+            attr = self._list_attr_map.get(id(sender))
+            if attr:
+                self.updateListAttr(sender, attr)
             return True
         else:
             return QtWidgets.QDialog.eventFilter(self, sender, event)
@@ -1772,8 +2124,9 @@ class GuideSettings(MayaQWidgetDockableMixin, QtWidgets.QDialog, HelperSlots):
         config["joint_description_letter_case"] = self.root.attr(
             "joint_description_letter_case").get()
 
-        if os.environ.get(MGEAR_SHIFTER_CUSTOMSTEP_KEY, ""):
-            startDir = os.environ.get(MGEAR_SHIFTER_CUSTOMSTEP_KEY, "")
+        cs_root = os.environ.get(MGEAR_SHIFTER_CUSTOMSTEP_KEY, "")
+        if cs_root:
+            startDir = cs_root
         else:
             startDir = pm.workspace(q=True, rootDirectory=True)
         data_string = json.dumps(config, indent=4, sort_keys=True)
@@ -1791,8 +2144,9 @@ class GuideSettings(MayaQWidgetDockableMixin, QtWidgets.QDialog, HelperSlots):
         f.close()
 
     def import_name_config(self, file_path=None):
-        if os.environ.get(MGEAR_SHIFTER_CUSTOMSTEP_KEY, ""):
-            startDir = os.environ.get(MGEAR_SHIFTER_CUSTOMSTEP_KEY, "")
+        cs_root = os.environ.get(MGEAR_SHIFTER_CUSTOMSTEP_KEY, "")
+        if cs_root:
+            startDir = cs_root
         else:
             startDir = pm.workspace(q=True, rootDirectory=True)
         if not file_path:
@@ -1843,18 +2197,13 @@ class GuideSettings(MayaQWidgetDockableMixin, QtWidgets.QDialog, HelperSlots):
         if not os.path.isdir(defPath):
             return
 
-        tabsDirectories = [name for name in os.listdir(defPath) if
-                           os.path.isdir(os.path.join(defPath, name))]
-        # Quick clean the first empty item
-        if tabsDirectories and not tabsDirectories[0]:
-            self.guideSettingsTab.available_listWidget.takeItem(0)
-
-        itemsList = self.root.attr("synoptic").get().split(",")
-        for tab in sorted(tabsDirectories):
-            if tab not in itemsList:
-                self.guideSettingsTab.available_listWidget.addItem(tab)
+        tabsDirectories = _get_synoptic_tabs(defPath)
+        itemsList = set(_split_attr(self.root.attr("synoptic").get()))
+        self.guideSettingsTab.available_listWidget.addItems(
+            [tab for tab in tabsDirectories if tab not in itemsList])
 
     def skinLoad(self, *args):
+        from mgear.core import skin
         startDir = self.root.attr("skin").get()
         filePath = pm.fileDialog2(
             fileMode=1,
@@ -1863,8 +2212,7 @@ class GuideSettings(MayaQWidgetDockableMixin, QtWidgets.QDialog, HelperSlots):
             fileFilter='mGear skin (*%s)' % skin.FILE_EXT)
         if not filePath:
             return
-        if not isinstance(filePath, basestring):
-            filePath = filePath[0]
+        filePath = filePath[0]
 
         self.root.attr("skin").set(filePath)
         self.guideSettingsTab.skin_lineEdit.setText(filePath)
@@ -1888,8 +2236,9 @@ class GuideSettings(MayaQWidgetDockableMixin, QtWidgets.QDialog, HelperSlots):
             stepWidget = self.customStepTab.postCustomStep_listWidget
 
         # Check if we have a custom env for the custom steps initial folder
-        if os.environ.get(MGEAR_SHIFTER_CUSTOMSTEP_KEY, ""):
-            startDir = os.environ.get(MGEAR_SHIFTER_CUSTOMSTEP_KEY, "")
+        cs_root = os.environ.get(MGEAR_SHIFTER_CUSTOMSTEP_KEY, "")
+        if cs_root:
+            startDir = cs_root
         else:
             startDir = self.root.attr(stepAttr).get()
 
@@ -1900,22 +2249,13 @@ class GuideSettings(MayaQWidgetDockableMixin, QtWidgets.QDialog, HelperSlots):
             fileFilter='Custom Step .py (*.py)')
         if not filePath:
             return
-        if not isinstance(filePath, basestring):
-            filePath = filePath[0]
+        filePath = filePath[0]
 
-        # Quick clean the first empty item
-        itemsList = [i.text() for i in stepWidget.findItems(
-            "", QtCore.Qt.MatchContains)]
-        if itemsList and not itemsList[0]:
-            stepWidget.takeItem(0)
-
-        if os.environ.get(MGEAR_SHIFTER_CUSTOMSTEP_KEY, ""):
-            filePath = os.path.abspath(filePath)
-            baseReplace = os.path.abspath(os.environ.get(
-                MGEAR_SHIFTER_CUSTOMSTEP_KEY, ""))
-            filePath = filePath.replace(baseReplace, "")[1:]
-
-        fileName = os.path.split(filePath)[1].split(".")[0]
+        if cs_root:
+            filePath = _custom_step_relpath(
+                filePath, os.path.abspath(cs_root))
+
+        fileName = _stem(filePath)
         stepWidget.addItem(fileName + " | " + filePath)
         self.updateListAttr(stepWidget, stepAttr)
         self.refreshStatusColor(stepWidget)
@@ -1939,8 +2279,9 @@ class GuideSettings(MayaQWidgetDockableMixin, QtWidgets.QDialog, HelperSlots):
             stepWidget = self.customStepTab.postCustomStep_listWidget
 
         # Check if we have a custom env for the custom steps initial folder
-        if os.environ.get(MGEAR_SHIFTER_CUSTOMSTEP_KEY, ""):
-            startDir = os.environ.get(MGEAR_SHIFTER_CUSTOMSTEP_KEY, "")
+        cs_root = os.environ.get(MGEAR_SHIFTER_CUSTOMSTEP_KEY, "")
+        if cs_root:
+            startDir = cs_root
         else:
             startDir = self.root.attr(stepAttr).get()
 
@@ -1951,8 +2292,7 @@ class GuideSettings(MayaQWidgetDockableMixin, QtWidgets.QDialog, HelperSlots):
             fileFilter='Custom Step .py (*.py)')
         if not filePath:
             return
-        if not isinstance(filePath, basestring):
-            filePath = filePath[0]
+        filePath = filePath[0]
 
         n, e = os.path.splitext(filePath)
         stepName = os.path.split(n)[-1]
@@ -1991,23 +2331,14 @@ class CustomShifterStep(cstp.customShifterMainStep):
             None: None
         """
         return'''.format(stepName=stepName)
-        f = open(filePath, 'w')
-        f.write(rawString + "\n")
-        f.close()
+        with open(filePath, 'w') as f:
+            f.write(rawString + "\n")
 
-        # Quick clean the first empty item
-        itemsList = [i.text() for i in stepWidget.findItems(
-            "", QtCore.Qt.MatchContains)]
-        if itemsList and not itemsList[0]:
-            stepWidget.takeItem(0)
-
-        if os.environ.get(MGEAR_SHIFTER_CUSTOMSTEP_KEY, ""):
-            filePath = os.path.abspath(filePath)
-            baseReplace = os.path.abspath(os.environ.get(
-                MGEAR_SHIFTER_CUSTOMSTEP_KEY, ""))
-            filePath = filePath.replace(baseReplace, "")[1:]
-
-        fileName = os.path.split(filePath)[1].split(".")[0]
+        if cs_root:
+            filePath = _custom_step_relpath(
+                filePath, os.path.abspath(cs_root))
+
+        fileName = _stem(filePath)
         stepWidget.addItem(fileName + " | " + filePath)
         self.updateListAttr(stepWidget, stepAttr)
         self.refreshStatusColor(stepWidget)
@@ -2031,14 +2362,15 @@ class CustomShifterStep(cstp.customShifterMainStep):
             stepWidget = self.customStepTab.postCustomStep_listWidget
 
         # Check if we have a custom env for the custom steps initial folder
-        if os.environ.get(MGEAR_SHIFTER_CUSTOMSTEP_KEY, ""):
-            startDir = os.environ.get(MGEAR_SHIFTER_CUSTOMSTEP_KEY, "")
+        cs_root = os.environ.get(MGEAR_SHIFTER_CUSTOMSTEP_KEY, "")
+        if cs_root:
+            startDir = cs_root
         else:
             startDir = self.root.attr(stepAttr).get()
 
         if stepWidget.selectedItems():
-            sourcePath = stepWidget.selectedItems()[0].text().split(
-                "|")[-1][1:]
+            sourcePath = stepWidget.selectedItems()[0].text().rpartition(
+                "|")[2][1:]
 
         filePath = pm.fileDialog2(
             fileMode=0,
@@ -2047,26 +2379,18 @@ class CustomShifterStep(cstp.customShifterMainStep):
             fileFilter='Custom Step .py (*.py)')
         if not filePath:
             return
-        if not isinstance(filePath, basestring):
-            filePath = filePath[0]
+        filePath = filePath[0]
 
-        if os.environ.get(MGEAR_SHIFTER_CUSTOMSTEP_KEY, ""):
+        if cs_root:
             sourcePath = os.path.join(startDir, sourcePath)
+        import shutil
         shutil.copy(sourcePath, filePath)
 
-        # Quick clean the first empty item
-        itemsList = [i.text() for i in stepWidget.findItems(
-            "", QtCore.Qt.MatchContains)]
-        if itemsList and not itemsList[0]:
-            stepWidget.takeItem(0)
-
-        if os.environ.get(MGEAR_SHIFTER_CUSTOMSTEP_KEY, ""):
-            filePath = os.path.abspath(filePath)
-            baseReplace = os.path.abspath(os.environ.get(
-                MGEAR_SHIFTER_CUSTOMSTEP_KEY, ""))
-            filePath = filePath.replace(baseReplace, "")[1:]
-
-        fileName = os.path.split(filePath)[1].split(".")[0]
+        if cs_root:
+            filePath = _custom_step_relpath(
+                filePath, os.path.abspath(cs_root))
+
+        fileName = _stem(filePath)
         stepWidget.addItem(fileName + " | " + filePath)
         self.updateListAttr(stepWidget, stepAttr)
         self.refreshStatusColor(stepWidget)
@@ -2089,22 +2413,15 @@ class CustomShifterStep(cstp.customShifterMainStep):
         else:
             stepWidget = self.customStepTab.postCustomStep_listWidget
 
-        # Quick clean the first empty item
-        itemsList = [i.text() for i in stepWidget.findItems(
-            "", QtCore.Qt.MatchContains)]
-        if itemsList and not itemsList[0]:
-            stepWidget.takeItem(0)
-
         # Check if we have a custom env for the custom steps initial folder
-        if os.environ.get(MGEAR_SHIFTER_CUSTOMSTEP_KEY, ""):
-            startDir = os.environ.get(MGEAR_SHIFTER_CUSTOMSTEP_KEY, "")
-            itemsList = [os.path.join(startDir, i.text().split("|")[-1][1:])
-                         for i in stepWidget.findItems(
-                         "", QtCore.Qt.MatchContains)]
+        cs_root = os.environ.get(MGEAR_SHIFTER_CUSTOMSTEP_KEY, "")
+        if cs_root:
+            startDir = cs_root
+            itemsList = [os.path.join(startDir, text.rpartition("|")[2][1:])
+                         for text in _items_text(stepWidget)]
         else:
-            itemsList = [i.text().split("|")[-1][1:]
-                         for i in stepWidget.findItems(
-                         "", QtCore.Qt.MatchContains)]
+            itemsList = [text.rpartition("|")[2][1:]
+                         for text in _items_text(stepWidget)]
             if itemsList:
                 startDir = os.path.split(itemsList[-1])[0]
             else:
@@ -2112,18 +2429,17 @@ class CustomShifterStep(cstp.customShifterMainStep):
                 return
         stepsDict = self.get_steps_dict(itemsList)
 
-        data_string = json.dumps(stepsDict, indent=4, sort_keys=True)
         filePath = pm.fileDialog2(
             fileMode=0,
             startingDirectory=startDir,
             fileFilter='Shifter Custom Steps .scs (*%s)' % ".scs")
         if not filePath:
             return
-        if not isinstance(filePath, basestring):
-            filePath = filePath[0]
-        f = open(filePath, 'w')
-        f.write(data_string)
-        f.close()
+        filePath = filePath[0]
+        # the steps source can be large, dump it directly to the file
+        with open(filePath, 'w', buffering=65536) as f:
+            json.dump(stepsDict, f, indent=4, sort_keys=True,
+                      separators=(",", ": "))
 
     def importCustomStep(self, pre=True, *args):
         """Import custom steps from a json file
@@ -2154,9 +2470,10 @@ class CustomShifterStep(cstp.customShifterMainStep):
             cancelButton='Cancel',
             dismissString='Cancel')
 
+        cs_root = os.environ.get(MGEAR_SHIFTER_CUSTOMSTEP_KEY, "")
         if option in ['Only Path', 'Unpack']:
-            if os.environ.get(MGEAR_SHIFTER_CUSTOMSTEP_KEY, ""):
-                startDir = os.environ.get(MGEAR_SHIFTER_CUSTOMSTEP_KEY, "")
+            if cs_root:
+                startDir = cs_root
             else:
                 startDir = pm.workspace(q=True, rootDirectory=True)
 
@@ -2166,9 +2483,9 @@ class CustomShifterStep(cstp.customShifterMainStep):
                 fileFilter='Shifter Custom Steps .scs (*%s)' % ".scs")
             if not filePath:
                 return
-            if not isinstance(filePath, basestring):
-                filePath = filePath[0]
-            stepDict = json.load(open(filePath))
+            filePath = filePath[0]
+            with open(filePath, 'r', buffering=65536) as f:
+                stepDict = json.load(f)
             stepsList = []
 
         if option == 'Only Path':
@@ -2179,52 +2496,48 @@ class CustomShifterStep(cstp.customShifterMainStep):
             unPackDir = pm.fileDialog2(
                 fileMode=2,
                 startingDirectory=startDir)
-            if not filePath:
+            if not unPackDir:
                 return
-            if not isinstance(unPackDir, basestring):
-                unPackDir = unPackDir[0]
+            unPackDir = unPackDir[0]
 
             for item in stepDict["itemsList"]:
                 fileName = os.path.split(item)[1]
                 fileNewPath = os.path.join(unPackDir, fileName)
                 stepsList.append(fileNewPath)
-                f = open(fileNewPath, 'w')
-                f.write(stepDict[item])
-                f.close()
+                with open(fileNewPath, 'w') as f:
+                    f.write(stepDict[item])
 
         if option in ['Only Path', 'Unpack']:
+            base_abs = os.path.abspath(cs_root) if cs_root else None
 
+            newItems = []
             for item in stepsList:
-                # Quick clean the first empty item
-                itemsList = [i.text() for i in stepWidget.findItems(
-                    "", QtCore.Qt.MatchContains)]
-                if itemsList and not itemsList[0]:
-                    stepWidget.takeItem(0)
-
-                if os.environ.get(MGEAR_SHIFTER_CUSTOMSTEP_KEY, ""):
-                    item = os.path.abspath(item)
-                    baseReplace = os.path.abspath(os.environ.get(
-                        MGEAR_SHIFTER_CUSTOMSTEP_KEY, ""))
-                    item = item.replace(baseReplace, "")[1:]
-
-                fileName = os.path.split(item)[1].split(".")[0]
-                stepWidget.addItem(fileName + " | " + item)
-                self.updateListAttr(stepWidget, stepAttr)
+                if base_abs:
+                    item = _custom_step_relpath(item, base_abs)
 
-    def _customStepMenu(self, cs_listWidget, stepAttr, QPos):
-        "right click context menu for custom step"
-        currentSelection = cs_listWidget.currentItem()
-        if currentSelection is None:
-            return
-        self.csMenu = QtWidgets.QMenu()
-        parentPosition = cs_listWidget.mapToGlobal(QtCore.QPoint(0, 0))
-        menu_item_01 = self.csMenu.addAction("Toggle Custom Step")
-        self.csMenu.addSeparator()
-        menu_item_02 = self.csMenu.addAction("Turn OFF Selected")
-        menu_item_03 = self.csMenu.addAction("Turn ON Selected")
-        self.csMenu.addSeparator()
-        menu_item_04 = self.csMenu.addAction("Turn OFF All")
-        menu_item_05 = self.csMenu.addAction("Turn ON All")
+                fileName = _stem(item)
+                newItems.append(fileName + " | " + item)
+            stepWidget.addItems(newItems)
+            self.updateListAttr(stepWidget, stepAttr)
+
+    def _buildCustomStepMenu(self, cs_listWidget, stepAttr):
+        """Create the right click context menu of a custom step list
+
+        Arguments:
+            cs_listWidget (QListWidget): The custom step list widget.
+            stepAttr (str): The custom step attribute of the list.
+
+        Returns:
+            QMenu: The context menu.
+        """
+        csMenu = QtWidgets.QMenu(self)
+        menu_item_01 = csMenu.addAction("Toggle Custom Step")
+        csMenu.addSeparator()
+        menu_item_02 = csMenu.addAction("Turn OFF Selected")
+        menu_item_03 = csMenu.addAction("Turn ON Selected")
+        csMenu.addSeparator()
+        menu_item_04 = csMenu.addAction("Turn OFF All")
+        menu_item_05 = csMenu.addAction("Turn ON All")
 
         menu_item_01.triggered.connect(partial(self.toggleStatusCustomStep,
                                                cs_listWidget,
@@ -2247,32 +2560,56 @@ class CustomShifterStep(cstp.customShifterMainStep):
                                                stepAttr,
                                                True,
                                                False))
+        return csMenu
 
+    def _customStepMenu(self, cs_listWidget, stepAttr, QPos):
+        "right click context menu for custom step"
+        currentSelection = cs_listWidget.currentItem()
+        if currentSelection is None:
+            return
+        # the menus are created once in create_connections
+        self.csMenu = self._csMenus[stepAttr]
+        parentPosition = cs_listWidget.mapToGlobal(QtCore.QPoint(0, 0))
         self.csMenu.move(parentPosition + QPos)
         self.csMenu.show()
 
     def preCustomStepMenu(self, QPos):
-        self._customStepMenu(self.customStepTab.preCustomStep_listWidget,
-                             "preCustomStep",
-                             QPos)
+        self._customStepMenu(self.pre_cs, "preCustomStep", QPos)
 
     def postCustomStepMenu(self, QPos):
-        self._customStepMenu(self.customStepTab.postCustomStep_listWidget,
-                             "postCustomStep",
-                             QPos)
+        self._customStepMenu(self.post_cs, "postCustomStep", QPos)
+
+    def _setCustomStepEnabled(self, item, enabled):
+        """Set the status of a custom step item
+
+        The deactivated steps have a "*" prefix in the item text, which is
+        also the value stored in the guide.
+
+        Arguments:
+            item (QListWidgetItem): The custom step item.
+            enabled (bool): The new status.
+
+        Returns:
+            bool: True if the status changed.
+        """
+        text = item.text()
+        off = text.startswith("*")
+        if off != enabled:
+            return False
+        item.setText(text[1:] if off else "*" + text)
+        return True
 
     def toggleStatusCustomStep(self, cs_listWidget, stepAttr):
         items = cs_listWidget.selectedItems()
+        changed = False
         for item in items:
-            if item.text().startswith("*"):
-                item.setText(item.text()[1:])
-                item.setForeground(self.whiteDownBrush)
-            else:
-                item.setText("*" + item.text())
-                item.setForeground(self.redBrush)
+            if self._setCustomStepEnabled(item, item.text().startswith("*")):
+                changed = True
 
-        self.updateListAttr(cs_listWidget, stepAttr)
-        self.refreshStatusColor(cs_listWidget)
+        # refreshStatusColor sets the color of the toggled items
+        if changed:
+            self.updateListAttr(cs_listWidget, stepAttr)
+            self.refreshStatusColor(cs_listWidget)
 
     def setStatusCustomStep(
             self, cs_listWidget, stepAttr, status=True, selected=True):
@@ -2280,50 +2617,61 @@ class CustomShifterStep(cstp.customShifterMainStep):
             items = cs_listWidget.selectedItems()
         else:
             items = self.getAllItems(cs_listWidget)
+        changed = False
         for item in items:
-            off = item.text().startswith("*")
-            if status and off:
-                item.setText(item.text()[1:])
-            elif not status and not off:
-                item.setText("*" + item.text())
-            self.setStatusColor(item)
-        self.updateListAttr(cs_listWidget, stepAttr)
-        self.refreshStatusColor(cs_listWidget)
+            # the items already in the requested status are not changed
+            if self._setCustomStepEnabled(item, status):
+                changed = True
+
+        # refreshStatusColor sets the color of the changed items
+        if changed:
+            self.updateListAttr(cs_listWidget, stepAttr)
+            self.refreshStatusColor(cs_listWidget)
 
     def getAllItems(self, cs_listWidget):
         return [cs_listWidget.item(i) for i in range(cs_listWidget.count())]
 
     def setStatusColor(self, item):
-        if item.text().startswith("*"):
+        text = item.text()
+        if text.startswith("*"):
             item.setForeground(self.redBrush)
-        elif "_shared" in item.text():
+        elif "_shared" in text:
             item.setForeground(self.greenBrush)
         else:
             item.setForeground(self.whiteDownBrush)
 
     def refreshStatusColor(self, cs_listWidget):
-        items = self.getAllItems(cs_listWidget)
-        for i in items:
-            self.setStatusColor(i)
+        # repaint the list once after all the items are set
+        cs_listWidget.setUpdatesEnabled(False)
+        try:
+            for i in self.getAllItems(cs_listWidget):
+                self.setStatusColor(i)
+        finally:
+            cs_listWidget.setUpdatesEnabled(True)
+            cs_listWidget.viewport().update()
 
     # Highligter filter
     def _highlightSearch(self, cs_listWidget, searchText):
+        matchColor = self._searchMatchColor
+        clearColor = self._searchClearColor
         items = self.getAllItems(cs_listWidget)
+        if not searchText:
+            for i in items:
+                i.setBackground(clearColor)
+            return
+
+        searchText = searchText.lower()
         for i in items:
-            if searchText and searchText.lower() in i.text().lower():
-                i.setBackground(QtGui.QColor(128, 128, 128, 255))
+            if searchText in i.text().lower():
+                i.setBackground(matchColor)
             else:
-                i.setBackground(QtGui.QColor(255, 255, 255, 0))
+                i.setBackground(clearColor)
 
     def preHighlightSearch(self):
-        searchText = self.customStepTab.preSearch_lineEdit.text()
-        self._highlightSearch(self.customStepTab.preCustomStep_listWidget,
-                              searchText)
+        self._highlightSearch(self.pre_cs, self.pre_search.text())
 
     def postHighlightSearch(self):
-        searchText = self.customStepTab.postSearch_lineEdit.text()
-        self._highlightSearch(self.customStepTab.postCustomStep_listWidget,
-                              searchText)
+        self._highlightSearch(self.post_cs, self.post_search.text())
 
 
 # Backwards compatibility aliases